@@ -52,40 +52,58 @@ def get_label(data):
     return data.get("id", "?")[:20]
 
 
+def k_hop_nodes(G, seed, k):
+    """Return the nodes within k hops of seed, ignoring edge direction.
+
+    Expands a BFS frontier over successors and predecessors, which avoids
+    copying the whole graph with to_undirected() just to take a neighborhood.
+    """
+    visited = {seed}
+    frontier = {seed}
+    for _ in range(k):
+        next_frontier = set()
+        for u in frontier:
+            next_frontier.update(G.succ[u])
+            next_frontier.update(G.pred[u])
+        next_frontier -= visited
+        visited |= next_frontier
+        frontier = next_frontier
+    return visited
+
+
 def main():
     print(f"Loading ATT&CK subset from {SUBSET_PATH}...")
     G = stix_to_graph(SUBSET_PATH)
     print(f"Full graph: {len(G.nodes)} nodes, {len(G.edges)} edges")
 
-    # Find APT28
+    # Find APT28, remembering the first intrusion-set in the same pass
     apt28_id = None
+    fallback_id = None
     for n, d in G.nodes(data=True):
         if d.get("name") == "APT28":
             apt28_id = n
             break
+        if fallback_id is None and d.get("type") == "intrusion-set":
+            fallback_id = n
 
-    if not apt28_id:
+    if not apt28_id and fallback_id:
         # Fall back to any intrusion-set
-        for n, d in G.nodes(data=True):
-            if d.get("type") == "intrusion-set":
-                apt28_id = n
-                print(f"APT28 not found, using {d.get('name', n)}")
-                break
+        apt28_id = fallback_id
+        print(f"APT28 not found, using {G.nodes[fallback_id].get('name', fallback_id)}")
 
     if not apt28_id:
         print("No intrusion-set found in subset, exiting")
         sys.exit(1)
 
-    # Extract 2-hop ego graph (undirected for neighborhood extraction)
-    undirected = G.to_undirected()
-    ego = nx.ego_graph(undirected, apt28_id, radius=2)
+    # Extract 2-hop neighborhood (in either edge direction)
+    ego_nodes = k_hop_nodes(G, apt28_id, 2)
 
     # Limit to manageable size — keep only closest nodes if too many
-    if len(ego.nodes) > 60:
-        ego = nx.ego_graph(undirected, apt28_id, radius=1)
+    if len(ego_nodes) > 60:
+        ego_nodes = k_hop_nodes(G, apt28_id, 1)
 
-    # Create directed subgraph from original graph
-    subgraph = G.subgraph(ego.nodes).copy()
+    # Directed subgraph view of the original graph (read-only, so no copy)
+    subgraph = G.subgraph(ego_nodes)
     print(f"Subgraph around {G.nodes[apt28_id].get('name', apt28_id)}: "
           f"{len(subgraph.nodes)} nodes, {len(subgraph.edges)} edges")
 
@@ -93,25 +111,23 @@ def main():
     fig, ax = plt.subplots(1, 1, figsize=(16, 12))
 
     # Node properties
-    node_colors = []
-    node_sizes = []
-    labels = {}
-    for n, d in subgraph.nodes(data=True):
-        node_type = d.get("type", "unknown")
-        node_colors.append(TYPE_COLORS.get(node_type, DEFAULT_COLOR))
-        # Make the focal node larger
-        node_sizes.append(800 if n == apt28_id else 400)
-        labels[n] = get_label(d)
-
-    # Layout
-    pos = nx.kamada_kawai_layout(subgraph)
-
-    # Draw edges
+    nodes = list(subgraph.nodes(data=True))
+    node_colors = [
+        TYPE_COLORS.get(d.get("type", "unknown"), DEFAULT_COLOR) for _, d in nodes
+    ]
+    # Make the focal node larger
+    node_sizes = [800 if n == apt28_id else 400 for n, _ in nodes]
+    labels = {n: get_label(d) for n, d in nodes}
+
+    # Layout: force-directed; Kamada-Kawai needs an all-pairs shortest-path
+    # matrix (and scipy), which is overkill for a one-off ~60-node drawing
+    pos = nx.spring_layout(subgraph, iterations=50, seed=42)
+
+    # Draw edges as a single LineCollection; arrows would add one
+    # FancyArrowPatch artist per edge
     nx.draw_networkx_edges(
         subgraph, pos, ax=ax,
-        edge_color="#cccccc", alpha=0.5, arrows=True,
-        arrowsize=10, width=0.8,
-        connectionstyle="arc3,rad=0.1",
+        edge_color="#cccccc", alpha=0.5, arrows=False, width=0.8,
     )
 
     # Draw nodes
@@ -129,7 +145,7 @@ def main():
 
     # Legend
     legend_elements = []
-    types_present = {d.get("type", "unknown") for _, d in subgraph.nodes(data=True)}
+    types_present = {d.get("type", "unknown") for _, d in nodes}
     for type_name in sorted(types_present):
         if type_name in TYPE_COLORS:
             legend_elements.append(
@@ -4,8 +4,8 @@ from typing import Union
 
 import networkx as nx
 
-from .converter import convert_bundle
-from .parsers import parse_source
+from .converter import convert_bundle, convert_objects
+from .parsers import iter_source, iter_source_objects, parse_source
 
 __version__ = "0.1.0"
 
@@ -14,6 +14,7 @@ def stix_to_graph(
     source: Union[str, list[str], list[dict]],
     graph_type: str = "multidigraph",
     include_scos: bool = True,
+    streaming: bool = False,
 ) -> Union[nx.MultiDiGraph, nx.DiGraph]:
     """Convert STIX bundle(s) to a NetworkX graph.
 
@@ -27,14 +28,22 @@ def stix_to_graph(
             multiple edges (last-write-wins).
         include_scos: Whether to include STIX Cyber-observable Objects as
             nodes. Default True.
+        streaming: Decode file and directory sources incrementally with
+            ijson, one object at a time, instead of loading each bundle into
+            memory first. Cuts peak memory on very large bundles at some cost
+            in parse speed. Requires the optional ``ijson`` dependency. Has
+            no effect on list sources, which are already in memory.
 
     Returns:
         A NetworkX MultiDiGraph or DiGraph populated with STIX objects.
+        List and dict attribute values are shared with the source bundle
+        objects, so bundles should not be mutated after conversion.
 
     Raises:
         ValueError: If source format is invalid, graph_type is unknown,
             or JSON parsing fails.
         FileNotFoundError: If a file or directory path doesn't exist.
+        ImportError: If streaming=True and ijson is not installed.
     """
     if graph_type == "multidigraph":
         graph = nx.MultiDiGraph()
@@ -45,9 +54,14 @@ def stix_to_graph(
             f"graph_type must be 'multidigraph' or 'digraph', got {graph_type!r}"
         )
 
-    bundles = parse_source(source)
+    if streaming and isinstance(source, str):
+        for objects in iter_source_objects(source):
+            convert_objects(graph, objects, include_scos=include_scos)
+        return graph
 
-    for bundle in bundles:
+    # Bundles are converted as they are parsed; for directories this overlaps
+    # reading the next files with converting the current one.
+    for bundle in iter_source(source):
         convert_bundle(graph, bundle, include_scos=include_scos)
 
     return graph
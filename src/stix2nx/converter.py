@@ -1,35 +1,28 @@
 """Core conversion logic: STIX bundle dicts to NetworkX graph objects."""
 
 import logging
+from typing import Callable, Iterable, Optional
 
 import networkx as nx
 
 from .utils import (
+    CUSTOM_SDO_PREFIXES,
+    SCO_TYPES,
+    SDO_TYPES,
+    SKIP_TYPES,
     extract_stix20_embedded_scos,
-    is_relationship,
-    is_sco,
-    is_sdo,
-    is_sighting,
-    is_skippable,
 )
 
 logger = logging.getLogger(__name__)
 
 
 def _obj_to_attrs(obj: dict) -> dict:
-    """Convert a STIX object dict to a dict of NetworkX node/edge attributes.
+    """Convert a STIX relationship dict to a dict of NetworkX edge attributes.
 
-    All properties are preserved. List-valued properties stay as Python lists.
+    All properties are preserved. Only the top-level dict is copied: list and
+    dict values are shared with the source object rather than duplicated.
     """
-    attrs = {}
-    for key, value in obj.items():
-        if isinstance(value, list):
-            attrs[key] = list(value)
-        elif isinstance(value, dict):
-            attrs[key] = dict(value)
-        else:
-            attrs[key] = value
-    return attrs
+    return dict(obj)
 
 
 def convert_bundle(
@@ -51,6 +44,29 @@ def convert_bundle(
     if not isinstance(objects, list):
         logger.warning("Bundle 'objects' field is not a list, skipping")
         return
+    convert_objects(graph, objects, include_scos=include_scos)
+
+
+def convert_objects(
+    graph: nx.MultiDiGraph | nx.DiGraph,
+    objects: Iterable[dict],
+    include_scos: bool = True,
+) -> None:
+    """Process an iterable of STIX objects into an existing NetworkX graph.
+
+    Same mapping as :func:`convert_bundle`, but objects are consumed one at a
+    time, so a streaming parser can feed them without building the bundle.
+
+    Args:
+        graph: The NetworkX graph to populate (modified in place).
+        objects: STIX object dicts, e.g. a bundle's ``objects`` list.
+        include_scos: Whether to include SCO objects as nodes.
+    """
+    # include_scos and the graph kind are resolved once here rather than
+    # re-checked per object
+    handlers = _HANDLER_TABLES[bool(include_scos), graph.is_multigraph()]
+    # Bound once: this loop runs per object, tens of thousands of times for ATT&CK
+    get_handler = handlers.get
 
     for obj in objects:
         if not isinstance(obj, dict):
@@ -64,41 +80,44 @@ def convert_bundle(
             logger.warning(f"Skipping object with no 'type' field: {obj}")
             continue
         if not obj_id:
-            if not is_skippable(obj):
+            if obj_type not in SKIP_TYPES:
                 logger.warning(f"Skipping object with no 'id' field: {obj}")
             continue
 
-        if is_skippable(obj):
-            continue
-        elif is_relationship(obj):
-            _add_relationship(graph, obj)
-        elif is_sighting(obj):
-            _add_sighting(graph, obj)
-        elif is_sdo(obj):
-            _add_node(graph, obj)
-            # Handle STIX 2.0 embedded SCOs in observed-data
-            if obj_type == "observed-data" and include_scos:
-                embedded_scos = extract_stix20_embedded_scos(obj)
-                for sco in embedded_scos:
-                    _add_node(graph, sco)
-        elif is_sco(obj):
-            if include_scos:
-                _add_node(graph, obj)
-        else:
-            # Unknown type — treat as a node (could be custom object)
-            logger.debug(f"Adding unknown object type as node: {obj_type}")
-            _add_node(graph, obj)
+        # One dict lookup replaces the is_* predicate chain. Skipped types map
+        # to None; anything not in the table is treated as a custom object.
+        handler = get_handler(obj_type, _add_custom)
+        if handler is not None:
+            handler(graph, obj)
 
 
 def _add_node(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
     """Add a STIX object as a node in the graph."""
     node_id = obj["id"]
-    attrs = _obj_to_attrs(obj)
-    graph.add_node(node_id, **attrs)
+    graph.add_node(node_id)
+    # Update the stored attribute dict directly instead of splatting **obj,
+    # which would build a throwaway kwargs dict per node.
+    graph._node[node_id].update(obj)
 
 
-def _add_relationship(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
-    """Add a STIX relationship as a directed edge in the graph."""
+def _add_observed_data(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
+    """Add an observed-data node plus any STIX 2.0 embedded SCOs as nodes."""
+    _add_node(graph, obj)
+    for sco in extract_stix20_embedded_scos(obj):
+        _add_node(graph, sco)
+
+
+def _add_custom(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
+    """Add an object whose type is not a known STIX type as a node."""
+    obj_type = obj["type"]
+    if not obj_type.startswith(CUSTOM_SDO_PREFIXES):
+        # Unknown type — treat as a node (could be custom object)
+        logger.debug(f"Adding unknown object type as node: {obj_type}")
+    _add_node(graph, obj)
+
+
+def _relationship_edge(obj: dict) -> Optional[tuple[str, str, dict]]:
+    """Return (source_ref, target_ref, edge attrs) for a relationship, or None if invalid."""
     source_ref = obj.get("source_ref")
     target_ref = obj.get("target_ref")
 
@@ -106,15 +125,35 @@ def _add_relationship(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
         logger.warning(
             f"Relationship {obj.get('id')} missing source_ref or target_ref, skipping"
         )
-        return
+        return None
 
     attrs = _obj_to_attrs(obj)
     # Remove source_ref and target_ref from edge attrs (they're encoded in the edge itself)
     attrs.pop("source_ref", None)
     attrs.pop("target_ref", None)
     attrs.pop("type", None)
+    return source_ref, target_ref, attrs
+
 
-    graph.add_edge(source_ref, target_ref, **attrs)
+def _add_relationship_multi(graph: nx.MultiDiGraph, obj: dict) -> None:
+    """Add a STIX relationship as a new keyed edge in a MultiDiGraph."""
+    edge = _relationship_edge(obj)
+    if edge is None:
+        return
+    source_ref, target_ref, attrs = edge
+    key = graph.add_edge(source_ref, target_ref)
+    # Update the stored edge dict directly rather than splatting **attrs
+    graph._adj[source_ref][target_ref][key].update(attrs)
+
+
+def _add_relationship_simple(graph: nx.DiGraph, obj: dict) -> None:
+    """Add a STIX relationship as an edge in a DiGraph (last write wins per key)."""
+    edge = _relationship_edge(obj)
+    if edge is None:
+        return
+    source_ref, target_ref, attrs = edge
+    graph.add_edge(source_ref, target_ref)
+    graph._adj[source_ref][target_ref].update(attrs)
 
 
 def _add_sighting(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
@@ -126,8 +165,7 @@ def _add_sighting(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
     - observed_data_refs → edges with relationship_type="observed"
     """
     node_id = obj["id"]
-    attrs = _obj_to_attrs(obj)
-    graph.add_node(node_id, **attrs)
+    _add_node(graph, obj)
 
     sighting_of = obj.get("sighting_of_ref")
     if sighting_of:
@@ -138,3 +176,31 @@ def _add_sighting(graph: nx.MultiDiGraph | nx.DiGraph, obj: dict) -> None:
 
     for ref in obj.get("observed_data_refs", []):
         graph.add_edge(node_id, ref, relationship_type="observed")
+
+
+# Per-type handlers for convert_bundle, called as handler(graph, obj).
+# None marks types that are skipped entirely.
+_HANDLERS: dict[str, Optional[Callable[[nx.DiGraph, dict], None]]] = {
+    **dict.fromkeys(SDO_TYPES, _add_node),
+    **dict.fromkeys(SCO_TYPES, _add_node),
+    **dict.fromkeys(SKIP_TYPES, None),
+    "observed-data": _add_observed_data,
+    "relationship": _add_relationship_multi,
+    "sighting": _add_sighting,
+}
+
+# Same table with SCOs skipped and observed-data added without its embedded SCOs
+_HANDLERS_NO_SCOS = {
+    **_HANDLERS,
+    **dict.fromkeys(SCO_TYPES, None),
+    "observed-data": _add_node,
+}
+
+# Tables keyed by (include_scos, graph.is_multigraph()), so the edge shape is
+# chosen once per bundle rather than branched on per relationship
+_HANDLER_TABLES = {
+    (True, True): _HANDLERS,
+    (False, True): _HANDLERS_NO_SCOS,
+    (True, False): {**_HANDLERS, "relationship": _add_relationship_simple},
+    (False, False): {**_HANDLERS_NO_SCOS, "relationship": _add_relationship_simple},
+}
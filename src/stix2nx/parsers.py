@@ -3,11 +3,26 @@
 import json
 import logging
 import os
-from glob import glob
-from typing import Union
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional, needed for streaming
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# orjson is several times faster than the stdlib on large bundles (e.g. ATT&CK).
+# Both accept str or bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError.
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 def parse_source(source: Union[str, list[str], list[dict]]) -> list[dict]:
     """Parse a STIX source into a list of bundle dicts.
@@ -36,6 +51,98 @@ def parse_source(source: Union[str, list[str], list[dict]]) -> list[dict]:
         )
 
 
+def iter_source(source: Union[str, list[str], list[dict]]) -> Iterator[dict]:
+    """Iterate over the STIX bundle dicts in a source.
+
+    Accepts the same sources as :func:`parse_source`. For directories, files
+    are parsed in a background thread pool while the caller consumes earlier
+    bundles, with at most one file per worker read ahead.
+
+    Raises:
+        ValueError: If the source format is invalid or JSON parsing fails.
+        FileNotFoundError: If a file or directory path doesn't exist.
+    """
+    if isinstance(source, str) and os.path.isdir(source):
+        return _iter_directory(source)
+    return iter(parse_source(source))
+
+
+def iter_source_objects(source: str) -> Iterator[Iterator[dict]]:
+    """Stream the STIX objects of a file or directory source without loading whole bundles.
+
+    Yields one iterator of object dicts per file (in sorted order for
+    directories). Each file is decoded incrementally with ijson, so peak memory
+    is bounded by the largest single object rather than the bundle size.
+
+    Raises:
+        ImportError: If ijson is not installed.
+        ValueError: If the source is not a file/directory path or JSON parsing fails.
+        FileNotFoundError: If a file path doesn't exist.
+    """
+    if ijson is None:
+        raise ImportError(
+            "Streaming requires the ijson package: pip install stix2nx[stream]"
+        )
+    if os.path.isdir(source):
+        files = _list_json_files(source)
+        if not files:
+            logger.warning(f"No .json files found in directory: {source}")
+        return (_iter_file_objects(f) for f in files)
+    elif source.endswith(".json") or os.path.isfile(source):
+        return iter([_iter_file_objects(source)])
+    else:
+        raise ValueError(
+            f"String source must be a path to a .json file or a directory, "
+            f"got: {source!r}"
+        )
+
+
+def _iter_file_objects(file_path: str) -> Iterator[dict]:
+    """Yield each entry of a bundle file's top-level ``objects`` array."""
+    if not os.path.isfile(file_path):
+        raise FileNotFoundError(f"STIX bundle file not found: {file_path}")
+    with open(file_path, "rb") as f:
+        try:
+            events = _checked_bundle_events(ijson.parse(f, use_float=True), file_path)
+            yield from ijson.items(events, "objects.item")
+        except ijson.JSONError as e:
+            raise ValueError(f"Failed to parse JSON from {file_path}: {e}") from e
+
+
+# Python type names for the ijson events that start a non-object JSON value
+_EVENT_TYPE_NAMES = {
+    "start_array": "list",
+    "string": "str",
+    "boolean": "bool",
+    "null": "NoneType",
+}
+
+
+def _checked_bundle_events(events: Iterator[tuple], file_path: str) -> Iterator[tuple]:
+    """Pass ijson parse events through, validating the bundle shape as it streams.
+
+    Mirrors the non-streaming path: a non-object top level raises the same
+    ValueError as :func:`_parse_file`, and a non-list ``objects`` field logs the
+    same warning as ``convert_bundle`` and contributes no objects. The rest of
+    the file is still consumed so malformed JSON is reported either way.
+    """
+    for prefix, event, value in events:
+        if event != "start_map":
+            type_name = _EVENT_TYPE_NAMES.get(event) or type(value).__name__
+            raise ValueError(f"Expected a JSON object (dict) in {file_path}, got {type_name}")
+        yield prefix, event, value
+        break
+    for prefix, event, value in events:
+        # Events prefixed "objects" (not "objects.item") are the field's own
+        # value: just start_array/end_array when it is a list
+        if prefix == "objects" and event not in ("start_array", "end_array"):
+            logger.warning("Bundle 'objects' field is not a list, skipping")
+            for _ in events:
+                pass
+            return
+        yield prefix, event, value
+
+
 def _parse_string_source(source: str) -> list[dict]:
     """Parse a string source (file path or directory path)."""
     if os.path.isdir(source):
@@ -51,24 +158,65 @@ def _parse_string_source(source: str) -> list[dict]:
 
 def _parse_directory(dir_path: str) -> list[dict]:
     """Parse all .json files in a directory (non-recursive)."""
-    pattern = os.path.join(dir_path, "*.json")
-    files = sorted(glob(pattern))
+    return list(_iter_directory(dir_path))
+
+
+def _iter_directory(dir_path: str) -> Iterator[dict]:
+    """Yield the parsed bundle of each .json file in a directory, in sorted order."""
+    files = _list_json_files(dir_path)
     if not files:
         logger.warning(f"No .json files found in directory: {dir_path}")
-        return []
-    bundles = []
-    for f in files:
-        bundles.append(_parse_file(f))
-    return bundles
+        return
+    if len(files) == 1:
+        yield _parse_file(files[0], check_exists=False)
+        return
+    # File reads release the GIL, so parsing in threads overlaps disk I/O and
+    # decoding with the caller's work on earlier bundles. Only max_workers files
+    # are in flight at a time, which bounds how many parsed bundles are held.
+    max_workers = min(len(files), os.cpu_count() or 4)
+    remaining = iter(files)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque(
+            executor.submit(_parse_file, f, check_exists=False)
+            for _, f in zip(range(max_workers), remaining)
+        )
+        while pending:
+            bundle = pending.popleft().result()
+            next_file = next(remaining, None)
+            if next_file is not None:
+                pending.append(executor.submit(_parse_file, next_file, check_exists=False))
+            yield bundle
 
 
-def _parse_file(file_path: str) -> dict:
-    """Parse a single JSON file into a bundle dict."""
-    if not os.path.isfile(file_path):
+def _list_json_files(dir_path: str) -> list[str]:
+    """Return the sorted paths of the non-hidden .json files in a directory.
+
+    os.scandir reports each entry's type from the directory listing itself, so
+    this avoids a separate stat per file.
+    """
+    with os.scandir(dir_path) as entries:
+        files = [
+            entry.path
+            for entry in entries
+            if entry.name.endswith(".json")
+            and not entry.name.startswith(".")
+            and entry.is_file()
+        ]
+    files.sort()
+    return files
+
+
+def _parse_file(file_path: str, check_exists: bool = True) -> dict:
+    """Parse a single JSON file into a bundle dict.
+
+    check_exists=False skips the isfile() check for paths already known to be
+    files, e.g. from a directory listing.
+    """
+    if check_exists and not os.path.isfile(file_path):
         raise FileNotFoundError(f"STIX bundle file not found: {file_path}")
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            bundle = json.load(f)
+        with open(file_path, "rb") as f:
+            bundle = _json_loads(f.read())
     except json.JSONDecodeError as e:
         raise ValueError(f"Failed to parse JSON from {file_path}: {e}") from e
     if not isinstance(bundle, dict):
@@ -93,7 +241,7 @@ def _parse_list_source(source: list) -> list[dict]:
                     f"got {type(s).__name__} at index {i}"
                 )
             try:
-                bundle = json.loads(s)
+                bundle = _json_loads(s)
             except json.JSONDecodeError as e:
                 raise ValueError(f"Failed to parse JSON string at index {i}: {e}") from e
             if not isinstance(bundle, dict):
@@ -108,19 +108,14 @@ def extract_stix20_embedded_scos(observed_data: dict) -> list[dict]:
         return []
 
     parent_id = observed_data.get("id", "observed-data--unknown")
+    # Synthetic IDs take the form parent-id--embedded-key
+    prefix = f"{parent_id}--embedded-"
     scos = []
 
     for key, obj in embedded.items():
-        if not isinstance(obj, dict):
+        if not isinstance(obj, dict) or not obj.get("type"):
             continue
-        obj_type = obj.get("type", "")
-        if not obj_type:
-            continue
-        sco = dict(obj)
-        # Create a synthetic ID: parent-id--embedded-key
-        sco["id"] = f"{parent_id}--embedded-{key}"
-        if "type" not in sco:
-            continue
-        scos.append(sco)
+        # Build a new dict rather than adding "id" to the caller's embedded object
+        scos.append({**obj, "id": prefix + key})
 
     return scos
@@ -1,562 +1,410 @@
-"""Shared test fixtures with hand-crafted minimal STIX bundles."""
+"""Shared test fixtures with hand-crafted minimal STIX bundles.
+
+Bundles and the prebuilt graphs are session-scoped and shared by every test
+that requests them, so tests must treat them (and any graph built from them,
+whose list/dict attributes are shared with the bundle) as read-only. Copy a
+bundle or graph before mutating it.
+"""
 
 import json
 
 import pytest
 
+from stix2nx import stix_to_graph
 
-@pytest.fixture
-def basic_bundle():
-    """A minimal STIX 2.1 bundle with SDOs and relationships."""
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Timestamp and spec version shared by most hand-crafted STIX 2.1 objects
+_TS = "2023-01-01T00:00:00.000Z"
+_SV = "2.1"
+
+
+def _sdo(type_, id_, **props):
+    """A STIX 2.1 domain object with the common properties filled in.
+
+    ``props`` are appended after the common properties and may override them
+    (e.g. a different ``created``/``modified``).
+    """
     return {
-        "type": "bundle",
-        "id": "bundle--1",
-        "objects": [
-            {
-                "type": "threat-actor",
-                "id": "threat-actor--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Evil Corp",
-                "aliases": ["BadGuys", "Villains"],
-                "threat_actor_types": ["criminal"],
-                "sophistication": "expert",
-            },
-            {
-                "type": "malware",
-                "id": "malware--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "EvilLoader",
-                "is_family": True,
-                "malware_types": ["trojan", "downloader"],
-            },
-            {
-                "type": "attack-pattern",
-                "id": "attack-pattern--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Spearphishing",
-                "kill_chain_phases": [
-                    {"kill_chain_name": "mitre-attack", "phase_name": "initial-access"}
-                ],
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "uses",
-                "source_ref": "threat-actor--1",
-                "target_ref": "malware--1",
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--2",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "uses",
-                "source_ref": "threat-actor--1",
-                "target_ref": "attack-pattern--1",
-            },
-        ],
+        "type": type_,
+        "id": id_,
+        "spec_version": _SV,
+        "created": _TS,
+        "modified": _TS,
+        **props,
     }
 
 
-@pytest.fixture
+def _rel(id_, relationship_type, source_ref, target_ref, **props):
+    """A STIX 2.1 relationship object."""
+    return _sdo(
+        "relationship",
+        id_,
+        relationship_type=relationship_type,
+        source_ref=source_ref,
+        target_ref=target_ref,
+        **props,
+    )
+
+
+def _sco(type_, id_, **props):
+    """A STIX 2.1 cyber-observable object (no created/modified)."""
+    return {"type": type_, "id": id_, "spec_version": _SV, **props}
+
+
+def _bundle(id_, *objects, **props):
+    """A STIX bundle wrapping ``objects``."""
+    return {"type": "bundle", "id": id_, **props, "objects": list(objects)}
+
+
+@pytest.fixture(scope="session")
+def basic_bundle():
+    """A minimal STIX 2.1 bundle with SDOs and relationships."""
+    return _bundle(
+        "bundle--1",
+        _sdo(
+            "threat-actor",
+            "threat-actor--1",
+            name="Evil Corp",
+            aliases=["BadGuys", "Villains"],
+            threat_actor_types=["criminal"],
+            sophistication="expert",
+        ),
+        _sdo(
+            "malware",
+            "malware--1",
+            name="EvilLoader",
+            is_family=True,
+            malware_types=["trojan", "downloader"],
+        ),
+        _sdo(
+            "attack-pattern",
+            "attack-pattern--1",
+            name="Spearphishing",
+            kill_chain_phases=[
+                {"kill_chain_name": "mitre-attack", "phase_name": "initial-access"}
+            ],
+        ),
+        _rel("relationship--1", "uses", "threat-actor--1", "malware--1"),
+        _rel("relationship--2", "uses", "threat-actor--1", "attack-pattern--1"),
+    )
+
+
+@pytest.fixture(scope="session")
 def basic_bundle_json(basic_bundle):
-    """The basic bundle as a JSON string."""
+    """The basic bundle as a JSON string, serialized once per session."""
+    if orjson is not None:
+        return orjson.dumps(basic_bundle).decode()
     return json.dumps(basic_bundle)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def basic_graph(basic_bundle):
+    """The basic bundle as a MultiDiGraph, built once per session."""
+    return stix_to_graph([basic_bundle])
+
+
+@pytest.fixture(scope="session")
+def basic_digraph(basic_bundle):
+    """The basic bundle as a DiGraph, built once per session."""
+    return stix_to_graph([basic_bundle], graph_type="digraph")
+
+
+@pytest.fixture(scope="session")
 def empty_bundle():
     """An empty STIX bundle with no objects."""
-    return {
-        "type": "bundle",
-        "id": "bundle--empty",
-        "objects": [],
-    }
+    return _bundle("bundle--empty")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def nodes_only_bundle():
     """A bundle with SDO nodes but no relationships."""
-    return {
-        "type": "bundle",
-        "id": "bundle--nodes-only",
-        "objects": [
-            {
-                "type": "threat-actor",
-                "id": "threat-actor--solo",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Lone Wolf",
-            },
-            {
-                "type": "malware",
-                "id": "malware--solo",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Orphan Malware",
-                "is_family": False,
-            },
-        ],
-    }
+    return _bundle(
+        "bundle--nodes-only",
+        _sdo("threat-actor", "threat-actor--solo", name="Lone Wolf"),
+        _sdo("malware", "malware--solo", name="Orphan Malware", is_family=False),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def basic_and_nodes_dir(tmp_path_factory, basic_bundle_json, nodes_only_bundle):
+    """A directory holding the basic and nodes-only bundles as two JSON files."""
+    d = tmp_path_factory.mktemp("basic_dir")
+    (d / "a.json").write_text(basic_bundle_json)
+    (d / "b.json").write_text(json.dumps(nodes_only_bundle))
+    return str(d)
+
+
+@pytest.fixture(scope="session")
 def marking_bundle():
     """A bundle containing marking definitions and language content (should be skipped)."""
-    return {
-        "type": "bundle",
-        "id": "bundle--marking",
-        "objects": [
-            {
-                "type": "marking-definition",
-                "id": "marking-definition--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "definition_type": "statement",
-                "definition": {"statement": "Copyright 2023"},
-            },
-            {
-                "type": "language-content",
-                "id": "language-content--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "object_ref": "threat-actor--1",
-                "object_modified": "2023-01-01T00:00:00.000Z",
-                "contents": {"de": {"name": "Boese Firma"}},
-            },
-            {
-                "type": "threat-actor",
-                "id": "threat-actor--with-marking",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Marked Actor",
-            },
-        ],
-    }
+    return _bundle(
+        "bundle--marking",
+        {
+            "type": "marking-definition",
+            "id": "marking-definition--1",
+            "spec_version": _SV,
+            "created": _TS,
+            "definition_type": "statement",
+            "definition": {"statement": "Copyright 2023"},
+        },
+        _sdo(
+            "language-content",
+            "language-content--1",
+            object_ref="threat-actor--1",
+            object_modified=_TS,
+            contents={"de": {"name": "Boese Firma"}},
+        ),
+        _sdo("threat-actor", "threat-actor--with-marking", name="Marked Actor"),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sco_bundle():
     """A bundle with various SCO types."""
-    return {
-        "type": "bundle",
-        "id": "bundle--sco",
-        "objects": [
-            {
-                "type": "indicator",
-                "id": "indicator--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Malicious IP",
-                "pattern": "[ipv4-addr:value = '198.51.100.1']",
-                "pattern_type": "stix",
-                "valid_from": "2023-01-01T00:00:00.000Z",
-            },
-            {
-                "type": "ipv4-addr",
-                "id": "ipv4-addr--1",
-                "spec_version": "2.1",
-                "value": "198.51.100.1",
-            },
-            {
-                "type": "domain-name",
-                "id": "domain-name--1",
-                "spec_version": "2.1",
-                "value": "evil.example.com",
-            },
-            {
-                "type": "file",
-                "id": "file--1",
-                "spec_version": "2.1",
-                "name": "malware.exe",
-                "hashes": {
-                    "SHA-256": "aabbccdd11223344aabbccdd11223344aabbccdd11223344aabbccdd11223344",
-                    "MD5": "aabbccdd11223344aabbccdd11223344",
-                },
-                "size": 1024,
-            },
-            {
-                "type": "url",
-                "id": "url--1",
-                "spec_version": "2.1",
-                "value": "https://evil.example.com/payload",
-            },
-            {
-                "type": "email-addr",
-                "id": "email-addr--1",
-                "spec_version": "2.1",
-                "value": "attacker@evil.example.com",
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--sco1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "based-on",
-                "source_ref": "indicator--1",
-                "target_ref": "ipv4-addr--1",
-            },
-        ],
-    }
+    return _bundle(
+        "bundle--sco",
+        _sdo(
+            "indicator",
+            "indicator--1",
+            name="Malicious IP",
+            pattern="[ipv4-addr:value = '198.51.100.1']",
+            pattern_type="stix",
+            valid_from=_TS,
+        ),
+        _sco("ipv4-addr", "ipv4-addr--1", value="198.51.100.1"),
+        _sco("domain-name", "domain-name--1", value="evil.example.com"),
+        _sco(
+            "file",
+            "file--1",
+            name="malware.exe",
+            hashes={
+                "SHA-256": "aabbccdd11223344aabbccdd11223344aabbccdd11223344aabbccdd11223344",
+                "MD5": "aabbccdd11223344aabbccdd11223344",
+            },
+            size=1024,
+        ),
+        _sco("url", "url--1", value="https://evil.example.com/payload"),
+        _sco("email-addr", "email-addr--1", value="attacker@evil.example.com"),
+        _rel("relationship--sco1", "based-on", "indicator--1", "ipv4-addr--1"),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sighting_bundle():
     """A bundle with sighting objects and their referenced entities."""
-    return {
-        "type": "bundle",
-        "id": "bundle--sighting",
-        "objects": [
-            {
-                "type": "identity",
-                "id": "identity--org1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "ACME Corp",
-                "identity_class": "organization",
-            },
-            {
-                "type": "indicator",
-                "id": "indicator--sighted",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Bad Indicator",
-                "pattern": "[ipv4-addr:value = '10.0.0.1']",
-                "pattern_type": "stix",
-                "valid_from": "2023-01-01T00:00:00.000Z",
-            },
-            {
-                "type": "observed-data",
-                "id": "observed-data--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "first_observed": "2023-01-01T00:00:00.000Z",
-                "last_observed": "2023-01-01T00:00:00.000Z",
-                "number_observed": 5,
-            },
-            {
-                "type": "intrusion-set",
-                "id": "intrusion-set--sighted",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Threat Group Alpha",
-            },
-            {
-                "type": "sighting",
-                "id": "sighting--full",
-                "spec_version": "2.1",
-                "created": "2023-06-15T10:00:00.000Z",
-                "modified": "2023-06-15T10:00:00.000Z",
-                "first_seen": "2023-06-01T00:00:00.000Z",
-                "last_seen": "2023-06-15T00:00:00.000Z",
-                "count": 3,
-                "sighting_of_ref": "indicator--sighted",
-                "where_sighted_refs": ["identity--org1"],
-                "observed_data_refs": ["observed-data--1"],
-            },
-            {
-                "type": "sighting",
-                "id": "sighting--minimal",
-                "spec_version": "2.1",
-                "created": "2023-07-01T00:00:00.000Z",
-                "modified": "2023-07-01T00:00:00.000Z",
-                "sighting_of_ref": "intrusion-set--sighted",
-            },
-        ],
-    }
+    return _bundle(
+        "bundle--sighting",
+        _sdo(
+            "identity",
+            "identity--org1",
+            name="ACME Corp",
+            identity_class="organization",
+        ),
+        _sdo(
+            "indicator",
+            "indicator--sighted",
+            name="Bad Indicator",
+            pattern="[ipv4-addr:value = '10.0.0.1']",
+            pattern_type="stix",
+            valid_from=_TS,
+        ),
+        _sdo(
+            "observed-data",
+            "observed-data--1",
+            first_observed=_TS,
+            last_observed=_TS,
+            number_observed=5,
+        ),
+        _sdo("intrusion-set", "intrusion-set--sighted", name="Threat Group Alpha"),
+        _sdo(
+            "sighting",
+            "sighting--full",
+            created="2023-06-15T10:00:00.000Z",
+            modified="2023-06-15T10:00:00.000Z",
+            first_seen="2023-06-01T00:00:00.000Z",
+            last_seen="2023-06-15T00:00:00.000Z",
+            count=3,
+            sighting_of_ref="indicator--sighted",
+            where_sighted_refs=["identity--org1"],
+            observed_data_refs=["observed-data--1"],
+        ),
+        _sdo(
+            "sighting",
+            "sighting--minimal",
+            created="2023-07-01T00:00:00.000Z",
+            modified="2023-07-01T00:00:00.000Z",
+            sighting_of_ref="intrusion-set--sighted",
+        ),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multi_edge_bundle():
     """A bundle where the same node pair has multiple relationships."""
-    return {
-        "type": "bundle",
-        "id": "bundle--multi-edge",
-        "objects": [
-            {
-                "type": "threat-actor",
-                "id": "threat-actor--multi",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Multi Actor",
-            },
-            {
-                "type": "malware",
-                "id": "malware--multi",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Multi Malware",
-                "is_family": True,
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--multi1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "uses",
-                "source_ref": "threat-actor--multi",
-                "target_ref": "malware--multi",
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--multi2",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "attributed-to",
-                "source_ref": "threat-actor--multi",
-                "target_ref": "malware--multi",
-            },
-        ],
-    }
+    return _bundle(
+        "bundle--multi-edge",
+        _sdo("threat-actor", "threat-actor--multi", name="Multi Actor"),
+        _sdo("malware", "malware--multi", name="Multi Malware", is_family=True),
+        _rel("relationship--multi1", "uses", "threat-actor--multi", "malware--multi"),
+        _rel(
+            "relationship--multi2",
+            "attributed-to",
+            "threat-actor--multi",
+            "malware--multi",
+        ),
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def stix20_bundle():
     """A STIX 2.0 bundle with spec_version on the bundle and embedded SCOs."""
-    return {
-        "type": "bundle",
-        "id": "bundle--stix20",
-        "spec_version": "2.0",
-        "objects": [
-            {
-                "type": "threat-actor",
-                "id": "threat-actor--20",
-                "created": "2020-01-01T00:00:00.000Z",
-                "modified": "2020-01-01T00:00:00.000Z",
-                "name": "Legacy Actor",
-                "labels": ["criminal"],
-            },
-            {
-                "type": "malware",
-                "id": "malware--20",
-                "created": "2020-01-01T00:00:00.000Z",
-                "modified": "2020-01-01T00:00:00.000Z",
-                "name": "Legacy Malware",
-                "labels": ["trojan"],
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--20",
-                "created": "2020-01-01T00:00:00.000Z",
-                "modified": "2020-01-01T00:00:00.000Z",
-                "relationship_type": "uses",
-                "source_ref": "threat-actor--20",
-                "target_ref": "malware--20",
-            },
-            {
-                "type": "observed-data",
-                "id": "observed-data--20",
-                "created": "2020-01-01T00:00:00.000Z",
-                "modified": "2020-01-01T00:00:00.000Z",
-                "first_observed": "2020-01-01T00:00:00.000Z",
-                "last_observed": "2020-01-01T00:00:00.000Z",
-                "number_observed": 1,
-                "objects": {
-                    "0": {
-                        "type": "ipv4-addr",
-                        "value": "203.0.113.50",
-                    },
-                    "1": {
-                        "type": "domain-name",
-                        "value": "legacy.example.com",
-                    },
+    return _bundle(
+        "bundle--stix20",
+        {
+            "type": "threat-actor",
+            "id": "threat-actor--20",
+            "created": "2020-01-01T00:00:00.000Z",
+            "modified": "2020-01-01T00:00:00.000Z",
+            "name": "Legacy Actor",
+            "labels": ["criminal"],
+        },
+        {
+            "type": "malware",
+            "id": "malware--20",
+            "created": "2020-01-01T00:00:00.000Z",
+            "modified": "2020-01-01T00:00:00.000Z",
+            "name": "Legacy Malware",
+            "labels": ["trojan"],
+        },
+        {
+            "type": "relationship",
+            "id": "relationship--20",
+            "created": "2020-01-01T00:00:00.000Z",
+            "modified": "2020-01-01T00:00:00.000Z",
+            "relationship_type": "uses",
+            "source_ref": "threat-actor--20",
+            "target_ref": "malware--20",
+        },
+        {
+            "type": "observed-data",
+            "id": "observed-data--20",
+            "created": "2020-01-01T00:00:00.000Z",
+            "modified": "2020-01-01T00:00:00.000Z",
+            "first_observed": "2020-01-01T00:00:00.000Z",
+            "last_observed": "2020-01-01T00:00:00.000Z",
+            "number_observed": 1,
+            "objects": {
+                "0": {
+                    "type": "ipv4-addr",
+                    "value": "203.0.113.50",
+                },
+                "1": {
+                    "type": "domain-name",
+                    "value": "legacy.example.com",
                 },
             },
-        ],
-    }
+        },
+        spec_version="2.0",
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def stix20_graph(stix20_bundle):
+    """The STIX 2.0 bundle as a MultiDiGraph, built once per session."""
+    return stix_to_graph([stix20_bundle])
+
+
+@pytest.fixture(scope="session")
+def stix20_graph_no_scos(stix20_bundle):
+    """The STIX 2.0 bundle as a MultiDiGraph without SCOs."""
+    return stix_to_graph([stix20_bundle], include_scos=False)
+
+
+@pytest.fixture(scope="session")
 def stix21_bundle():
     """A STIX 2.1 bundle with 2.1-specific types."""
-    return {
-        "type": "bundle",
-        "id": "bundle--stix21",
-        "objects": [
-            {
-                "type": "infrastructure",
-                "id": "infrastructure--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "C2 Server",
-                "infrastructure_types": ["command-and-control"],
-            },
-            {
-                "type": "location",
-                "id": "location--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Eastern Europe",
-                "region": "eastern-europe",
-            },
-            {
-                "type": "malware-analysis",
-                "id": "malware-analysis--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "product": "CuckooSandbox",
-                "result": "malicious",
-            },
-            {
-                "type": "note",
-                "id": "note--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "content": "This actor is highly dangerous.",
-                "object_refs": ["threat-actor--1"],
-            },
-            {
-                "type": "opinion",
-                "id": "opinion--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "opinion": "strongly-agree",
-                "object_refs": ["threat-actor--1"],
-            },
-            {
-                "type": "grouping",
-                "id": "grouping--1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Threat Cluster Alpha",
-                "context": "suspicious-activity",
-                "object_refs": ["infrastructure--1", "location--1"],
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--21-1",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "located-at",
-                "source_ref": "infrastructure--1",
-                "target_ref": "location--1",
-            },
-        ],
-    }
+    return _bundle(
+        "bundle--stix21",
+        _sdo(
+            "infrastructure",
+            "infrastructure--1",
+            name="C2 Server",
+            infrastructure_types=["command-and-control"],
+        ),
+        _sdo("location", "location--1", name="Eastern Europe", region="eastern-europe"),
+        _sdo(
+            "malware-analysis",
+            "malware-analysis--1",
+            product="CuckooSandbox",
+            result="malicious",
+        ),
+        _sdo(
+            "note",
+            "note--1",
+            content="This actor is highly dangerous.",
+            object_refs=["threat-actor--1"],
+        ),
+        _sdo(
+            "opinion",
+            "opinion--1",
+            opinion="strongly-agree",
+            object_refs=["threat-actor--1"],
+        ),
+        _sdo(
+            "grouping",
+            "grouping--1",
+            name="Threat Cluster Alpha",
+            context="suspicious-activity",
+            object_refs=["infrastructure--1", "location--1"],
+        ),
+        _rel("relationship--21-1", "located-at", "infrastructure--1", "location--1"),
+    )
+
+
+@pytest.fixture(scope="session")
+def stix21_graph(stix21_bundle):
+    """The STIX 2.1 bundle as a MultiDiGraph, built once per session."""
+    return stix_to_graph([stix21_bundle])
 
 
-@pytest.fixture
+def _merge_variant(suffix, malware_name, is_family, created):
+    """A merge-test bundle: one actor using the shared ``malware--shared`` node."""
+    actor_id = f"threat-actor--merge-{suffix}"
+    return _bundle(
+        f"bundle--{suffix}",
+        _sdo("threat-actor", actor_id, name=f"Actor {suffix.upper()}"),
+        _sdo(
+            "malware",
+            "malware--shared",
+            created=created,
+            modified=created,
+            name=malware_name,
+            is_family=is_family,
+        ),
+        _rel(f"relationship--merge-{suffix}", "uses", actor_id, "malware--shared"),
+    )
+
+
+@pytest.fixture(scope="session")
 def merge_bundle_a():
     """First bundle for merge tests."""
-    return {
-        "type": "bundle",
-        "id": "bundle--a",
-        "objects": [
-            {
-                "type": "threat-actor",
-                "id": "threat-actor--merge-a",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Actor A",
-            },
-            {
-                "type": "malware",
-                "id": "malware--shared",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Shared Malware v1",
-                "is_family": True,
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--merge-a",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "uses",
-                "source_ref": "threat-actor--merge-a",
-                "target_ref": "malware--shared",
-            },
-        ],
-    }
+    return _merge_variant("a", "Shared Malware v1", True, _TS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def merge_bundle_b():
     """Second bundle for merge tests (overlapping malware--shared node)."""
-    return {
-        "type": "bundle",
-        "id": "bundle--b",
-        "objects": [
-            {
-                "type": "threat-actor",
-                "id": "threat-actor--merge-b",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Actor B",
-            },
-            {
-                "type": "malware",
-                "id": "malware--shared",
-                "spec_version": "2.1",
-                "created": "2023-02-01T00:00:00.000Z",
-                "modified": "2023-02-01T00:00:00.000Z",
-                "name": "Shared Malware v2",
-                "is_family": False,
-            },
-            {
-                "type": "relationship",
-                "id": "relationship--merge-b",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "relationship_type": "uses",
-                "source_ref": "threat-actor--merge-b",
-                "target_ref": "malware--shared",
-            },
-        ],
-    }
+    return _merge_variant("b", "Shared Malware v2", False, "2023-02-01T00:00:00.000Z")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def merge_bundle_c():
     """Third bundle for merge tests (completely new nodes)."""
-    return {
-        "type": "bundle",
-        "id": "bundle--c",
-        "objects": [
-            {
-                "type": "tool",
-                "id": "tool--merge-c",
-                "spec_version": "2.1",
-                "created": "2023-01-01T00:00:00.000Z",
-                "modified": "2023-01-01T00:00:00.000Z",
-                "name": "Hack Tool",
-                "tool_types": ["exploitation"],
-            },
-        ],
-    }
+    return _bundle(
+        "bundle--c",
+        _sdo("tool", "tool--merge-c", name="Hack Tool", tool_types=["exploitation"]),
+    )
@@ -13,6 +13,17 @@ import json
 import os
 import sys
 from collections import Counter
+from itertools import islice
+
+import ijson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 ATTACK_URL = (
     "https://raw.githubusercontent.com/mitre/cti/master/"
@@ -44,22 +55,35 @@ TARGET_TOOLS = {
 
 
 def download_bundle():
-    """Download the full ATT&CK Enterprise STIX bundle."""
-    import requests
+    """Download the full ATT&CK Enterprise STIX bundle and index its objects.
 
+    The response is parsed incrementally as it arrives, so the raw JSON text
+    and the parsed objects are never held in memory at the same time.
+    """
     print(f"Downloading ATT&CK bundle from {ATTACK_URL}...")
-    resp = requests.get(ATTACK_URL, timeout=120)
+    session = http_session()
+    resp = session.get(ATTACK_URL, stream=True, timeout=(10, 120))
     resp.raise_for_status()
-    bundle = resp.json()
-    print(f"Downloaded {len(resp.text) // 1024 // 1024}MB, {len(bundle.get('objects', []))} objects")
-    return bundle
-
-
-def build_subset(bundle):
-    """Extract a curated subset from the full ATT&CK bundle."""
-    objects = bundle.get("objects", [])
-
-    # Index objects by ID and type
+    resp.raw.decode_content = True
+    with session, resp:
+        by_id, by_type = index_objects(
+            ijson.items(resp.raw, "objects.item", use_float=True)
+        )
+        print(f"Downloaded {resp.raw.tell() // 1024 // 1024}MB, {len(by_id)} objects")
+    return by_id, by_type
+
+
+def http_session():
+    """A requests session that retries transient connection failures."""
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=Retry(total=2, backoff_factor=0.5))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def index_objects(objects):
+    """Index STIX objects by ID and by type."""
     by_id = {}
     by_type = {}
     for obj in objects:
@@ -69,25 +93,40 @@ def build_subset(bundle):
             by_id[obj_id] = obj
         if obj_type:
             by_type.setdefault(obj_type, []).append(obj)
+    return by_id, by_type
 
+
+def build_subset(by_id, by_type):
+    """Extract a curated subset from the indexed ATT&CK objects."""
     selected_ids = set()
     selected_objects = []
+    by_selected_type = {}
 
     def select(obj):
         obj_id = obj.get("id")
         if obj_id and obj_id not in selected_ids:
             selected_ids.add(obj_id)
             selected_objects.append(obj)
+            by_selected_type.setdefault(obj.get("type"), []).append(obj_id)
+
+    def select_many(objs):
+        """Select several objects with one bulk update of the ID set."""
+        new = {}
+        for obj in objs:
+            obj_id = obj.get("id")
+            if obj_id and obj_id not in selected_ids:
+                new.setdefault(obj_id, obj)
+        selected_ids.update(new)
+        selected_objects.extend(new.values())
+        for obj_id, obj in new.items():
+            by_selected_type.setdefault(obj.get("type"), []).append(obj_id)
 
     # 1. x-mitre-matrix and x-mitre-tactic objects (ATT&CK matrix structure)
-    for obj in by_type.get("x-mitre-matrix", []):
-        select(obj)
-    for obj in by_type.get("x-mitre-tactic", []):
-        select(obj)
+    select_many(by_type.get("x-mitre-matrix", []))
+    select_many(by_type.get("x-mitre-tactic", []))
 
     # 2. Identity objects (MITRE identity used as created_by_ref)
-    for obj in by_type.get("identity", []):
-        select(obj)
+    select_many(by_type.get("identity", []))
 
     # 3. Target intrusion sets
     intrusion_sets = by_type.get("intrusion-set", [])
@@ -101,92 +140,78 @@ def build_subset(bundle):
         if obj.get("name") in TARGET_TOOLS:
             select(obj)
 
-    # 5. Collect all relationships
+    # 5. Collect all relationships, resolving each endpoint's type once so the
+    # selection steps below compare tags instead of re-scanning refs. Refs to
+    # objects missing from the bundle get a None type and are never selected.
     relationships = by_type.get("relationship", [])
+    id_to_type = {obj_id: obj.get("type") for obj_id, obj in by_id.items()}
+    rel_ends = []
 
-    # Find malware and attack-patterns connected to selected intrusion sets
-    connected_malware = set()
+    # Find malware and attack-patterns connected to selected intrusion sets,
+    # in the same pass, counting how many selected objects each malware links to
+    malware_connection_count = Counter()
     connected_attack_patterns = set()
     for rel in relationships:
         src = rel.get("source_ref", "")
         tgt = rel.get("target_ref", "")
+        src_type = id_to_type.get(src)
+        tgt_type = id_to_type.get(tgt)
+        rel_ends.append((src, tgt, src_type, tgt_type))
         if src in selected_ids:
-            if tgt.startswith("malware--"):
-                connected_malware.add(tgt)
-            elif tgt.startswith("attack-pattern--"):
+            if tgt_type == "malware":
+                malware_connection_count[tgt] += 1
+            elif tgt_type == "attack-pattern":
                 connected_attack_patterns.add(tgt)
         if tgt in selected_ids:
-            if src.startswith("malware--"):
-                connected_malware.add(src)
-            elif src.startswith("attack-pattern--"):
+            if src_type == "malware":
+                malware_connection_count[src] += 1
+            elif src_type == "attack-pattern":
                 connected_attack_patterns.add(src)
 
     # 6. Select malware (up to ~10, prioritize most connected)
-    malware_connection_count = Counter(connected_malware)
     top_malware = [mid for mid, _ in malware_connection_count.most_common(10)]
     for mid in top_malware:
-        if mid in by_id:
-            select(by_id[mid])
+        select(by_id[mid])
 
     # 7. Select attack-patterns (up to ~30, prioritize most connected)
     ap_connection_count = Counter()
-    for rel in relationships:
-        src = rel.get("source_ref", "")
-        tgt = rel.get("target_ref", "")
-        if tgt.startswith("attack-pattern--") and tgt in connected_attack_patterns:
+    for src, tgt, src_type, tgt_type in rel_ends:
+        if tgt_type == "attack-pattern" and tgt in connected_attack_patterns:
             ap_connection_count[tgt] += 1
-        if src.startswith("attack-pattern--") and src in connected_attack_patterns:
+        if src_type == "attack-pattern" and src in connected_attack_patterns:
             ap_connection_count[src] += 1
     top_aps = [apid for apid, _ in ap_connection_count.most_common(30)]
     for apid in top_aps:
-        if apid in by_id:
-            select(by_id[apid])
+        select(by_id[apid])
+
+    def linked_unselected(obj_type):
+        """Yield unselected objects of obj_type related to a selected object."""
+        for src, tgt, src_type, tgt_type in rel_ends:
+            if src_type == obj_type and tgt in selected_ids:
+                if src not in selected_ids:
+                    yield src
+            elif tgt_type == obj_type and src in selected_ids:
+                if tgt not in selected_ids:
+                    yield tgt
 
     # 8. Select campaigns (up to ~5)
-    campaigns = by_type.get("campaign", [])
-    campaign_count = 0
-    for rel in relationships:
-        if campaign_count >= 5:
-            break
-        src = rel.get("source_ref", "")
-        tgt = rel.get("target_ref", "")
-        if src.startswith("campaign--") and (tgt in selected_ids):
-            if src in by_id and src not in selected_ids:
-                select(by_id[src])
-                campaign_count += 1
-        elif tgt.startswith("campaign--") and (src in selected_ids):
-            if tgt in by_id and tgt not in selected_ids:
-                select(by_id[tgt])
-                campaign_count += 1
+    for cid in islice(linked_unselected("campaign"), 5):
+        select(by_id[cid])
 
     # 9. Select courses of action (up to ~3)
-    coas = by_type.get("course-of-action", [])
-    coa_count = 0
-    for rel in relationships:
-        if coa_count >= 3:
-            break
-        src = rel.get("source_ref", "")
-        tgt = rel.get("target_ref", "")
-        if src.startswith("course-of-action--") and tgt in selected_ids:
-            if src in by_id and src not in selected_ids:
-                select(by_id[src])
-                coa_count += 1
-        elif tgt.startswith("course-of-action--") and src in selected_ids:
-            if tgt in by_id and tgt not in selected_ids:
-                select(by_id[tgt])
-                coa_count += 1
+    for coa_id in islice(linked_unselected("course-of-action"), 3):
+        select(by_id[coa_id])
 
     # 10. Select vulnerability objects (up to ~5)
     vulns = by_type.get("vulnerability", [])
-    for obj in vulns[:5]:
-        select(obj)
+    select_many(vulns[:5])
 
     # 11. Select all relationships where BOTH endpoints are in our selected set
-    for rel in relationships:
-        src = rel.get("source_ref", "")
-        tgt = rel.get("target_ref", "")
-        if src in selected_ids and tgt in selected_ids:
-            select(rel)
+    select_many(
+        rel
+        for rel, (src, tgt, _, _) in zip(relationships, rel_ends)
+        if src in selected_ids and tgt in selected_ids
+    )
 
     # 12. Add synthetic SCOs (ATT&CK is SDO-focused, so we add these for test coverage)
     synthetic_scos = [
@@ -272,13 +297,8 @@ def build_subset(bundle):
     ]
 
     # Pick a real intrusion set ID for sighting references
-    real_intrusion_set_id = None
-    real_identity_id = None
-    for obj in selected_objects:
-        if obj.get("type") == "intrusion-set" and real_intrusion_set_id is None:
-            real_intrusion_set_id = obj["id"]
-        if obj.get("type") == "identity" and real_identity_id is None:
-            real_identity_id = obj["id"]
+    real_intrusion_set_id = next(iter(by_selected_type.get("intrusion-set", [])), None)
+    real_identity_id = next(iter(by_selected_type.get("identity", [])), None)
 
     # 13. Add synthetic sightings
     synthetic_sightings = [
@@ -308,13 +328,12 @@ def build_subset(bundle):
     ]
 
     # Add all synthetic objects
-    for obj in (
+    select_many(
         synthetic_scos
         + synthetic_indicators
         + synthetic_rels
         + synthetic_sightings
-    ):
-        select(obj)
+    )
 
     # Build the output bundle
     subset_bundle = {
@@ -338,8 +357,8 @@ def build_subset(bundle):
     return subset_bundle, dangling
 
 
-def print_summary(subset_bundle, dangling):
-    """Print a summary of the subset."""
+def print_summary(subset_bundle, dangling, file_size):
+    """Print a summary of the subset written to a file of ``file_size`` bytes."""
     objects = subset_bundle["objects"]
     type_counts = Counter(obj.get("type") for obj in objects)
 
@@ -347,7 +366,7 @@ def print_summary(subset_bundle, dangling):
     print("ATT&CK Subset Summary")
     print(f"{'='*50}")
     print(f"Total objects: {len(objects)}")
-    print(f"File size: {len(json.dumps(subset_bundle)) // 1024}KB")
+    print(f"File size: {file_size // 1024}KB")
     print(f"Dangling references: {dangling}")
     print(f"\nObject counts by type:")
     for type_name, count in sorted(type_counts.items(), key=lambda x: -x[1]):
@@ -366,15 +385,19 @@ def print_summary(subset_bundle, dangling):
 
 
 def main():
-    bundle = download_bundle()
-    subset_bundle, dangling = build_subset(bundle)
+    by_id, by_type = download_bundle()
+    subset_bundle, dangling = build_subset(by_id, by_type)
 
     # Write output
-    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
-        json.dump(subset_bundle, f, indent=2)
+    if orjson is not None:
+        with open(OUTPUT_PATH, "wb") as f:
+            f.write(orjson.dumps(subset_bundle, option=orjson.OPT_INDENT_2))
+    else:
+        with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+            json.dump(subset_bundle, f, indent=2)
     print(f"\nWrote subset to {OUTPUT_PATH}")
 
-    print_summary(subset_bundle, dangling)
+    print_summary(subset_bundle, dangling, os.path.getsize(OUTPUT_PATH))
 
 
 if __name__ == "__main__":
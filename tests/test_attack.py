@@ -5,32 +5,40 @@ With STIX2NX_LIVE_ATTACK=true: downloads and tests against the full ~30MB bundle
 """
 
 import os
+import shutil
 
 import pytest
 
+from stix2nx import stix_to_graph
+
 LIVE_FLAG = os.environ.get("STIX2NX_LIVE_ATTACK", "false").lower() == "true"
 ATTACK_URL = "https://raw.githubusercontent.com/mitre/cti/master/enterprise-attack/enterprise-attack.json"
 SUBSET_PATH = os.path.join(os.path.dirname(__file__), "data", "attack-subset.json")
 
+# requests is only needed (and only required) for the live download
+requests = None
+if LIVE_FLAG:
+    import requests
+
 # Minimum thresholds: low enough for the subset, meaningful enough to catch breakage
 MIN_NODES = 80
 MIN_EDGES = 80
 
 
-@pytest.fixture
-def attack_bundle_path(tmp_path):
+@pytest.fixture(scope="session")
+def attack_bundle_path(tmp_path_factory):
     """Get ATT&CK bundle. Default: curated subset. With STIX2NX_LIVE_ATTACK=true: full live bundle."""
     if LIVE_FLAG:
         try:
-            import requests
-
-            resp = requests.get(ATTACK_URL, timeout=120)
+            resp = requests.get(ATTACK_URL, stream=True, timeout=120)
             resp.raise_for_status()
-            live_path = tmp_path / "enterprise-attack.json"
-            live_path.write_text(resp.text)
+            resp.raw.decode_content = True
+            live_path = tmp_path_factory.mktemp("attack") / "enterprise-attack.json"
+            with resp, open(live_path, "wb") as f:
+                shutil.copyfileobj(resp.raw, f)
             print(
                 f"\nUsing live ATT&CK bundle from {ATTACK_URL} "
-                f"({len(resp.text) // 1024 // 1024}MB)"
+                f"({os.path.getsize(live_path) // 1024 // 1024}MB)"
             )
             return str(live_path)
         except Exception as e:
@@ -41,20 +49,36 @@ def attack_bundle_path(tmp_path):
     return SUBSET_PATH
 
 
-def test_attack_loads(attack_bundle_path):
-    """ATT&CK bundle converts to a graph without error."""
-    from stix2nx import stix_to_graph
+# The ATT&CK graphs are expensive to build and only read by the tests below,
+# so each variant is built once per session.
+@pytest.fixture(scope="session")
+def attack_graph(attack_bundle_path):
+    """ATT&CK bundle as a MultiDiGraph (default options)."""
+    return stix_to_graph(attack_bundle_path)
+
+
+@pytest.fixture(scope="session")
+def attack_digraph(attack_bundle_path):
+    """ATT&CK bundle as a DiGraph."""
+    return stix_to_graph(attack_bundle_path, graph_type="digraph")
+
+
+@pytest.fixture(scope="session")
+def attack_graph_no_scos(attack_bundle_path):
+    """ATT&CK bundle as a MultiDiGraph without SCO nodes."""
+    return stix_to_graph(attack_bundle_path, include_scos=False)
 
-    G = stix_to_graph(attack_bundle_path)
+
+def test_attack_loads(attack_graph):
+    """ATT&CK bundle converts to a graph without error."""
+    G = attack_graph
     assert len(G.nodes) >= MIN_NODES
     assert len(G.edges) >= MIN_EDGES
 
 
-def test_attack_has_expected_types(attack_bundle_path):
+def test_attack_has_expected_types(attack_graph):
     """ATT&CK graph contains the core node types."""
-    from stix2nx import stix_to_graph
-
-    G = stix_to_graph(attack_bundle_path)
+    G = attack_graph
     types = {data["type"] for _, data in G.nodes(data=True)}
     assert "attack-pattern" in types
     assert "intrusion-set" in types
@@ -63,11 +87,9 @@ def test_attack_has_expected_types(attack_bundle_path):
     assert "relationship" not in types  # relationships should be edges, not nodes
 
 
-def test_attack_relationship_attributes(attack_bundle_path):
+def test_attack_relationship_attributes(attack_graph):
     """Edges have relationship_type attributes."""
-    from stix2nx import stix_to_graph
-
-    G = stix_to_graph(attack_bundle_path)
+    G = attack_graph
     rel_types = set()
     for u, v, data in G.edges(data=True):
         if "relationship_type" in data:
@@ -75,11 +97,9 @@ def test_attack_relationship_attributes(attack_bundle_path):
     assert "uses" in rel_types  # ATT&CK heavily uses "uses" relationships
 
 
-def test_attack_node_attributes(attack_bundle_path):
+def test_attack_node_attributes(attack_graph):
     """Nodes have expected STIX attributes preserved."""
-    from stix2nx import stix_to_graph
-
-    G = stix_to_graph(attack_bundle_path)
+    G = attack_graph
     # Find any attack-pattern node and verify it has a name
     for n, data in G.nodes(data=True):
         if data.get("type") == "attack-pattern":
@@ -89,29 +109,23 @@ def test_attack_node_attributes(attack_bundle_path):
             break
 
 
-def test_attack_digraph(attack_bundle_path):
+def test_attack_digraph(attack_digraph):
     """ATT&CK converts to DiGraph without error."""
-    from stix2nx import stix_to_graph
-
-    G = stix_to_graph(attack_bundle_path, graph_type="digraph")
+    G = attack_digraph
     assert len(G.nodes) >= MIN_NODES
 
 
-def test_attack_no_scos(attack_bundle_path):
+def test_attack_no_scos(attack_graph, attack_graph_no_scos):
     """ATT&CK converts with include_scos=False without error."""
-    from stix2nx import stix_to_graph
-
-    G_with = stix_to_graph(attack_bundle_path, include_scos=True)
-    G_without = stix_to_graph(attack_bundle_path, include_scos=False)
+    G_with = attack_graph
+    G_without = attack_graph_no_scos
     # With SCOs should have >= as many nodes
     assert len(G_with.nodes) >= len(G_without.nodes)
 
 
-def test_attack_sightings(attack_bundle_path):
+def test_attack_sightings(attack_graph):
     """Sighting objects in the subset become nodes with edges."""
-    from stix2nx import stix_to_graph
-
-    G = stix_to_graph(attack_bundle_path)
+    G = attack_graph
     sighting_nodes = [
         n for n, d in G.nodes(data=True) if d.get("type") == "sighting"
     ]
@@ -1,23 +1,25 @@
 """Unit tests for basic SDO-to-node and relationship-to-edge conversion."""
 
+import pytest
+
 from stix2nx import stix_to_graph
 
 
-def test_sdos_become_nodes(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_sdos_become_nodes(basic_graph):
+    G = basic_graph
     assert "threat-actor--1" in G.nodes
     assert "malware--1" in G.nodes
     assert "attack-pattern--1" in G.nodes
 
 
-def test_node_ids_match_stix_ids(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_node_ids_match_stix_ids(basic_graph):
+    G = basic_graph
     for node_id in G.nodes:
         assert G.nodes[node_id]["id"] == node_id
 
 
-def test_node_attributes_correct(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_node_attributes_correct(basic_graph):
+    G = basic_graph
     ta = G.nodes["threat-actor--1"]
     assert ta["type"] == "threat-actor"
     assert ta["name"] == "Evil Corp"
@@ -25,8 +27,8 @@ def test_node_attributes_correct(basic_bundle):
     assert ta["created"] == "2023-01-01T00:00:00.000Z"
 
 
-def test_list_properties_remain_lists(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_list_properties_remain_lists(basic_graph):
+    G = basic_graph
     ta = G.nodes["threat-actor--1"]
     assert isinstance(ta["aliases"], list)
     assert ta["aliases"] == ["BadGuys", "Villains"]
@@ -38,22 +40,22 @@ def test_list_properties_remain_lists(basic_bundle):
     assert mal["malware_types"] == ["trojan", "downloader"]
 
 
-def test_all_properties_preserved(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_all_properties_preserved(basic_graph):
+    G = basic_graph
     ap = G.nodes["attack-pattern--1"]
     assert "kill_chain_phases" in ap
     assert isinstance(ap["kill_chain_phases"], list)
     assert ap["kill_chain_phases"][0]["phase_name"] == "initial-access"
 
 
-def test_relationships_become_edges(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_relationships_become_edges(basic_graph):
+    G = basic_graph
     assert G.has_edge("threat-actor--1", "malware--1")
     assert G.has_edge("threat-actor--1", "attack-pattern--1")
 
 
-def test_edge_attributes(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_edge_attributes(basic_graph):
+    G = basic_graph
     edges = list(G.edges("threat-actor--1", data=True))
     rel_types = {d["relationship_type"] for _, _, d in edges}
     assert "uses" in rel_types
@@ -90,21 +92,67 @@ def test_json_string_input(basic_bundle_json):
     assert len(G.edges) == 2
 
 
-def test_file_input(basic_bundle, tmp_path):
-    import json
-
+def test_file_input(basic_bundle_json, tmp_path):
     file_path = tmp_path / "test.json"
-    file_path.write_text(json.dumps(basic_bundle))
+    file_path.write_text(basic_bundle_json)
     G = stix_to_graph(str(file_path))
     assert len(G.nodes) == 3
     assert len(G.edges) == 2
 
 
-def test_directory_input(basic_bundle, nodes_only_bundle, tmp_path):
-    import json
-
-    (tmp_path / "a.json").write_text(json.dumps(basic_bundle))
-    (tmp_path / "b.json").write_text(json.dumps(nodes_only_bundle))
-    G = stix_to_graph(str(tmp_path))
+def test_directory_input(basic_and_nodes_dir):
+    G = stix_to_graph(basic_and_nodes_dir)
     # 3 from basic + 2 from nodes_only = 5
     assert len(G.nodes) == 5
+
+
+def test_invalid_json_string_raises():
+    with pytest.raises(ValueError, match="index 0"):
+        stix_to_graph(["{not json"])
+
+
+def test_invalid_json_file_raises(tmp_path):
+    file_path = tmp_path / "broken.json"
+    file_path.write_text("{not json")
+    with pytest.raises(ValueError, match="broken.json"):
+        stix_to_graph(str(file_path))
+
+
+def test_custom_types_become_nodes():
+    bundle = {
+        "type": "bundle",
+        "id": "bundle--custom",
+        "objects": [
+            {"type": "x-mitre-tactic", "id": "x-mitre-tactic--1", "name": "Execution"},
+            {"type": "x-acme-widget", "id": "x-acme-widget--1", "name": "Widget"},
+        ],
+    }
+    G = stix_to_graph([bundle])
+    assert G.nodes["x-mitre-tactic--1"]["name"] == "Execution"
+    assert G.nodes["x-acme-widget--1"]["name"] == "Widget"
+
+
+def test_objects_without_id_skipped(caplog):
+    bundle = {
+        "type": "bundle",
+        "id": "bundle--no-id",
+        "objects": [
+            {"type": "marking-definition", "definition_type": "statement"},
+            {"type": "malware", "name": "Nameless"},
+        ],
+    }
+    with caplog.at_level("WARNING", logger="stix2nx"):
+        G = stix_to_graph([bundle])
+    assert len(G.nodes) == 0
+    # Only the non-skippable object is reported
+    assert len(caplog.records) == 1
+    assert "no 'id' field" in caplog.records[0].getMessage()
+
+
+def test_directory_input_ignores_non_files(basic_bundle_json, tmp_path):
+    (tmp_path / "a.json").write_text(basic_bundle_json)
+    (tmp_path / "nested.json").mkdir()
+    (tmp_path / ".hidden.json").write_text("{not json")
+    (tmp_path / "notes.txt").write_text("ignored")
+    G = stix_to_graph(str(tmp_path))
+    assert len(G.nodes) == 3
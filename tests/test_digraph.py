@@ -1,17 +1,18 @@
 """Tests for DiGraph vs MultiDiGraph output."""
 
 import networkx as nx
+import pytest
 
 from stix2nx import stix_to_graph
 
 
-def test_multidigraph_is_default(basic_bundle):
-    G = stix_to_graph([basic_bundle])
+def test_multidigraph_is_default(basic_graph):
+    G = basic_graph
     assert isinstance(G, nx.MultiDiGraph)
 
 
-def test_digraph_output(basic_bundle):
-    G = stix_to_graph([basic_bundle], graph_type="digraph")
+def test_digraph_output(basic_digraph):
+    G = basic_digraph
     assert isinstance(G, nx.DiGraph)
     assert not isinstance(G, nx.MultiDiGraph)
 
@@ -40,9 +41,9 @@ def test_same_node_set(multi_edge_bundle):
     assert set(G_multi.nodes) == set(G_di.nodes)
 
 
-def test_shortest_path_works_on_both(basic_bundle):
-    G_multi = stix_to_graph([basic_bundle], graph_type="multidigraph")
-    G_di = stix_to_graph([basic_bundle], graph_type="digraph")
+def test_shortest_path_works_on_both(basic_graph, basic_digraph):
+    G_multi = basic_graph
+    G_di = basic_digraph
 
     path_multi = nx.shortest_path(G_multi, "threat-actor--1", "malware--1")
     path_di = nx.shortest_path(G_di, "threat-actor--1", "malware--1")
@@ -52,7 +53,5 @@ def test_shortest_path_works_on_both(basic_bundle):
 
 
 def test_invalid_graph_type(basic_bundle):
-    import pytest
-
     with pytest.raises(ValueError, match="graph_type"):
         stix_to_graph([basic_bundle], graph_type="undirected")
@@ -1,5 +1,8 @@
 """Tests for merging multiple bundles."""
 
+import json
+import os
+
 from stix2nx import stix_to_graph
 
 
@@ -42,11 +45,34 @@ def test_merge_three_bundles(merge_bundle_a, merge_bundle_b, merge_bundle_c):
 
 
 def test_merge_json_strings(merge_bundle_a, merge_bundle_b):
-    import json
-
     json_a = json.dumps(merge_bundle_a)
     json_b = json.dumps(merge_bundle_b)
     G = stix_to_graph([json_a, json_b])
     assert "threat-actor--merge-a" in G.nodes
     assert "threat-actor--merge-b" in G.nodes
     assert "malware--shared" in G.nodes
+
+
+def test_merge_directory_later_file_wins(merge_bundle_a, merge_bundle_b, tmp_path):
+    (tmp_path / "1-a.json").write_text(json.dumps(merge_bundle_a))
+    (tmp_path / "2-b.json").write_text(json.dumps(merge_bundle_b))
+    G = stix_to_graph(str(tmp_path))
+    # Files are merged in sorted order regardless of parse concurrency
+    assert G.nodes["malware--shared"]["name"] == "Shared Malware v2"
+
+
+def test_merge_directory_more_files_than_workers(tmp_path):
+    n_files = (os.cpu_count() or 4) + 3
+    for i in range(n_files):
+        bundle = {
+            "type": "bundle",
+            "id": f"bundle--{i}",
+            "objects": [
+                {"type": "tool", "id": f"tool--{i}", "name": f"Tool {i}"},
+                {"type": "malware", "id": "malware--shared", "name": f"Version {i}"},
+            ],
+        }
+        (tmp_path / f"{i:03d}.json").write_text(json.dumps(bundle))
+    G = stix_to_graph(str(tmp_path))
+    assert len(G.nodes) == n_files + 1
+    assert G.nodes["malware--shared"]["name"] == f"Version {n_files - 1}"
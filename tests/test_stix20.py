@@ -3,19 +3,19 @@
 from stix2nx import stix_to_graph
 
 
-def test_stix20_loads(stix20_bundle):
-    G = stix_to_graph([stix20_bundle])
+def test_stix20_loads(stix20_graph):
+    G = stix20_graph
     assert "threat-actor--20" in G.nodes
     assert "malware--20" in G.nodes
 
 
-def test_stix20_relationship(stix20_bundle):
-    G = stix_to_graph([stix20_bundle])
+def test_stix20_relationship(stix20_graph):
+    G = stix20_graph
     assert G.has_edge("threat-actor--20", "malware--20")
 
 
-def test_stix20_embedded_scos_extracted(stix20_bundle):
-    G = stix_to_graph([stix20_bundle], include_scos=True)
+def test_stix20_embedded_scos_extracted(stix20_graph):
+    G = stix20_graph
     # observed-data node should exist
     assert "observed-data--20" in G.nodes
     # Embedded SCOs should be extracted with synthetic IDs
@@ -30,8 +30,8 @@ def test_stix20_embedded_scos_extracted(stix20_bundle):
     assert domain_node["value"] == "legacy.example.com"
 
 
-def test_stix20_embedded_scos_excluded(stix20_bundle):
-    G = stix_to_graph([stix20_bundle], include_scos=False)
+def test_stix20_embedded_scos_excluded(stix20_graph_no_scos):
+    G = stix20_graph_no_scos
     # observed-data SDO should still exist
     assert "observed-data--20" in G.nodes
     # But embedded SCOs should NOT be extracted
@@ -39,18 +39,24 @@ def test_stix20_embedded_scos_excluded(stix20_bundle):
     assert "observed-data--20--embedded-1" not in G.nodes
 
 
-def test_stix20_no_newer_types(stix20_bundle):
+def test_stix20_no_newer_types(stix20_graph):
     """STIX 2.0 bundles without infrastructure/location/etc work fine."""
-    G = stix_to_graph([stix20_bundle])
-    types = {d["type"] for _, d in G.nodes(data=True)}
+    G = stix20_graph
     # Should not crash, just have the types that are present
-    assert "threat-actor" in types
-    assert "malware" in types
+    assert G.nodes["threat-actor--20"]["type"] == "threat-actor"
+    assert G.nodes["malware--20"]["type"] == "malware"
 
 
-def test_stix20_node_attributes(stix20_bundle):
-    G = stix_to_graph([stix20_bundle])
+def test_stix20_node_attributes(stix20_graph):
+    G = stix20_graph
     ta = G.nodes["threat-actor--20"]
     assert ta["name"] == "Legacy Actor"
     assert isinstance(ta["labels"], list)
     assert ta["labels"] == ["criminal"]
+
+
+def test_stix20_embedded_scos_input_unchanged(stix20_bundle):
+    stix_to_graph([stix20_bundle], include_scos=True)
+    embedded = stix20_bundle["objects"][3]["objects"]
+    assert "id" not in embedded["0"]
+    assert "id" not in embedded["1"]
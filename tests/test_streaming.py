@@ -0,0 +1,72 @@
+"""Tests for streaming (ijson) ingestion of file and directory sources."""
+
+import json
+import os
+
+import pytest
+
+from stix2nx import stix_to_graph
+
+pytest.importorskip("ijson")
+
+SUBSET_PATH = os.path.join(os.path.dirname(__file__), "data", "attack-subset.json")
+
+
+def test_streaming_matches_default_file():
+    G_stream = stix_to_graph(SUBSET_PATH, streaming=True)
+    G = stix_to_graph(SUBSET_PATH)
+    assert dict(G_stream.nodes(data=True)) == dict(G.nodes(data=True))
+    assert list(G_stream.edges(keys=True, data=True)) == list(G.edges(keys=True, data=True))
+
+
+def test_streaming_directory(basic_bundle, nodes_only_bundle, tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps(basic_bundle))
+    (tmp_path / "b.json").write_text(json.dumps(nodes_only_bundle))
+    G = stix_to_graph(str(tmp_path), streaming=True)
+    assert len(G.nodes) == 5
+    assert len(G.edges) == 2
+
+
+def test_streaming_respects_include_scos(sco_bundle, tmp_path):
+    file_path = tmp_path / "sco.json"
+    file_path.write_text(json.dumps(sco_bundle))
+    G = stix_to_graph(str(file_path), include_scos=False, streaming=True)
+    assert "indicator--1" in G.nodes
+    assert "domain-name--1" not in G.nodes
+
+
+def test_streaming_list_source_unaffected(basic_bundle):
+    G = stix_to_graph([basic_bundle], streaming=True)
+    assert len(G.nodes) == 3
+
+
+def test_streaming_invalid_json_raises(tmp_path):
+    file_path = tmp_path / "broken.json"
+    file_path.write_text('{"objects": [{"type": ')
+    with pytest.raises(ValueError, match="broken.json"):
+        stix_to_graph(str(file_path), streaming=True)
+
+
+def test_streaming_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        stix_to_graph(str(tmp_path / "missing.json"), streaming=True)
+
+
+def test_streaming_non_object_file_raises(tmp_path):
+    file_path = tmp_path / "array.json"
+    file_path.write_text("[1, 2]")
+    with pytest.raises(ValueError, match="Expected a JSON object"):
+        stix_to_graph(str(file_path))
+    with pytest.raises(ValueError, match="Expected a JSON object"):
+        stix_to_graph(str(file_path), streaming=True)
+
+
+def test_streaming_objects_not_list_warns(tmp_path, caplog):
+    file_path = tmp_path / "bad-objects.json"
+    file_path.write_text('{"type": "bundle", "objects": {"a": 1}}')
+    for streaming in (False, True):
+        caplog.clear()
+        with caplog.at_level("WARNING", logger="stix2nx"):
+            G = stix_to_graph(str(file_path), streaming=streaming)
+        assert len(G.nodes) == 0
+        assert "'objects' field is not a list" in caplog.text